@@ -0,0 +1,160 @@
+# bench_ingest.py
+# Compares the old JSON ingestion path against the gzip CSV path in ingest.py
+# on a synthetic local stand-in for the Chicago Data Portal response.
+# Each path is parsed in its own subprocess and peak memory is the growth in
+# peak RSS across the parse, so the pandas C tokenizer's own buffers are
+# counted along with Python and numpy allocations.
+# Usage: python bench_ingest.py [rows]
+import csv
+import gzip
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from ingest import CRIME_DTYPES, DATE_COLUMN, read_crimes_csv
+
+PRIMARY_TYPES = ["THEFT", "BATTERY", "CRIMINAL DAMAGE", "ASSAULT", "DECEPTIVE PRACTICE",
+                 "MOTOR VEHICLE THEFT", "OTHER OFFENSE", "ROBBERY", "BURGLARY", "NARCOTICS"]
+DESCRIPTIONS = ["SIMPLE", "OVER $500", "$500 AND UNDER", "TO VEHICLE", "DOMESTIC BATTERY SIMPLE",
+                "AUTOMOBILE", "RETAIL THEFT", "ARMED - HANDGUN", "FORCIBLE ENTRY", "POSSESS - CANNABIS"]
+LOCATIONS = ["STREET", "APARTMENT", "RESIDENCE", "SIDEWALK", "PARKING LOT / GARAGE (NON RESIDENTIAL)",
+             "SMALL RETAIL STORE", "RESTAURANT", "ALLEY", "DEPARTMENT STORE", "GAS STATION"]
+
+
+def make_rows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    start = np.datetime64('2024-01-01T00:00:00')
+    dates = start + rng.integers(0, 365 * 24 * 3600, n).astype('timedelta64[s]')
+    rows = []
+    for i in range(n):
+        district = rng.integers(1, 26)
+        rows.append({
+            'case_number': f"JH{rng.integers(100000, 1000000)}",
+            'block': f"{rng.integers(0, 100):03d}XX W {rng.integers(1, 130)}TH ST",
+            'iucr': f"{rng.integers(100, 5000):04d}",
+            'beat': f"{district:02d}{rng.integers(11, 35)}",
+            'district': f"{district:03d}",
+            'ward': str(rng.integers(1, 51)),
+            'fbi_code': f"{rng.integers(1, 27):02d}",
+            'date': pd.Timestamp(dates[i]).strftime("%Y-%m-%dT%H:%M:%S.000"),
+            'primary_type': PRIMARY_TYPES[rng.integers(len(PRIMARY_TYPES))],
+            'description': DESCRIPTIONS[rng.integers(len(DESCRIPTIONS))],
+            'location_description': LOCATIONS[rng.integers(len(LOCATIONS))],
+            'arrest': bool(rng.random() < 0.15),
+            'community_area': str(rng.integers(1, 78)),
+            'latitude': f"{41.65 + rng.random() * 0.37:.9f}",
+            'longitude': f"{-87.94 + rng.random() * 0.42:.9f}",
+        })
+    return rows
+
+
+def encode_json(rows):
+    return json.dumps(rows).encode()
+
+
+def encode_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=[DATE_COLUMN] + list(CRIME_DTYPES))
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(dict(row, arrest=str(row['arrest']).lower()))
+    return buffer.getvalue().encode()
+
+
+def parse_json(body):
+    # Mirrors the previous load_data: row dicts first, then column conversions
+    df = pd.DataFrame(json.loads(body))
+    df['community_area'] = df['community_area'].astype(int)
+    df['date'] = pd.to_datetime(df['date'])
+    df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
+    df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
+    return df
+
+
+def parse_csv_gzip(body):
+    return read_crimes_csv(gzip.GzipFile(fileobj=io.BytesIO(body)))
+
+
+PARSERS = {'json': parse_json, 'csv+gzip': parse_csv_gzip}
+
+
+def peak_rss():
+    # On Linux ru_maxrss carries over the parent's peak through fork and exec,
+    # so read this process's own high-water mark instead
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def measure(name, body_path, repeat=5):
+    # Runs inside a fresh interpreter so earlier work does not raise the peak
+    parse = PARSERS[name]
+    with open(body_path, 'rb') as f:
+        body = f.read()
+    before = peak_rss()
+    parse(body)
+    peak = peak_rss() - before
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(body)
+        timings.append(time.perf_counter() - start)
+    print(min(timings), peak)
+
+
+def run_measure(name, body):
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(body)
+    try:
+        output = subprocess.run([sys.executable, __file__, '--measure', name, f.name],
+                                check=True, capture_output=True, text=True).stdout
+    finally:
+        os.unlink(f.name)
+    seconds, peak = output.split()
+    return float(seconds), int(peak)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rows = make_rows(n)
+    json_body = encode_json(rows)
+    csv_body = encode_csv(rows)
+    del rows
+
+    json_gzip = gzip.compress(json_body)
+    csv_gzip = gzip.compress(csv_body)
+
+    json_df = parse_json(json_body)
+    csv_df = parse_csv_gzip(csv_gzip)
+    assert len(json_df) == len(csv_df) == n
+    assert (json_df['date'].values == csv_df['date'].values).all()
+    assert np.allclose(json_df['latitude'], csv_df['latitude'])
+    del json_df, csv_df
+
+    json_time, json_peak = run_measure('json', json_body)
+    csv_time, csv_peak = run_measure('csv+gzip', csv_gzip)
+
+    print(f"rows: {n}")
+    print(f"{'path':<12}{'raw bytes':>14}{'gzip bytes':>14}{'parse s':>10}{'peak RSS MiB':>14}")
+    print(f"{'json':<12}{len(json_body):>14}{len(json_gzip):>14}{json_time:>10.3f}{json_peak / 2**20:>14.1f}")
+    print(f"{'csv+gzip':<12}{len(csv_body):>14}{len(csv_gzip):>14}{csv_time:>10.3f}{csv_peak / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--measure']:
+        measure(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,55 @@
+# ingest.py
+import pandas as pd
+import requests
+
+CRIMES_URL = "https://data.cityofchicago.org/resource/ijzp-q8t2.csv"
+
+# Columns the pages actually use, with their dtypes known up front so the
+# C parser builds typed arrays directly instead of going through row dicts.
+# Text stays object: the pages filter then call value_counts, and on a
+# categorical that reports every filtered-out value with a zero count.
+# The identifiers are only read by the sidebar search and keep their
+# leading zeros as text, as in the JSON export
+CRIME_DTYPES = {
+    'case_number': 'object',
+    'block': 'object',
+    'iucr': 'object',
+    'beat': 'object',
+    'district': 'object',
+    'ward': 'object',
+    'fbi_code': 'object',
+    'primary_type': 'object',
+    'description': 'object',
+    'location_description': 'object',
+    'arrest': 'boolean',
+    'community_area': 'Int64',
+    'latitude': 'float64',
+    'longitude': 'float64',
+}
+DATE_COLUMN = 'date'
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+def read_crimes_csv(stream):
+    # stream is any binary file-like object holding the CSV export
+    return pd.read_csv(
+        stream,
+        usecols=[DATE_COLUMN] + list(CRIME_DTYPES),
+        dtype=CRIME_DTYPES,
+        parse_dates=[DATE_COLUMN],
+        date_format=DATE_FORMAT,
+        engine='c',
+    )
+
+
+def fetch_crimes(limit=10000):
+    params = {
+        "$limit": limit,
+        "$select": ",".join([DATE_COLUMN] + list(CRIME_DTYPES)),
+    }
+    # Ask for a gzip transfer and let urllib3 inflate it while pandas reads,
+    # so the decoded body is never held as one Python string
+    with requests.get(CRIMES_URL, params=params, headers={"Accept-Encoding": "gzip"}, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return read_crimes_csv(response.raw)
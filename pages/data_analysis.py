@@ -2,19 +2,16 @@ import streamlit as st
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
-import requests
 import numpy as np
 import pydeck as pdk
 from datetime import datetime, timedelta
 from matplotlib.colors import LinearSegmentedColormap
 import time
+from ingest import fetch_crimes
 # Function to load data from the Chicago Data Portal
 @st.cache_data
 def load_data():
-    url = "https://data.cityofchicago.org/resource/ijzp-q8t2.json"
-    data = requests.get(url, params={"$limit": 10000}).json()  # Fetching 10,000 record
-    df = pd.DataFrame(data)
-    df['date'] = pd.to_datetime(df['date'])
+    df = fetch_crimes(limit=10000)  # Fetching 10,000 records
     df['year'] = df['date'].dt.year
     df['month'] = df['date'].dt.month
     df['day'] = df['date'].dt.day
@@ -190,7 +187,7 @@ def run():
             st.subheader("Amount of Crime Type per Community Area")
             
             # Replace community area numbers with names
-            filtered_data['community_area'] = filtered_data['community_area'].astype(int).map(community_area_names)
+            filtered_data['community_area'] = filtered_data['community_area'].map(community_area_names)
             
             # Group data by community_area and primary_type before dropping the column
             crime_counts = filtered_data.groupby(['community_area', 'primary_type']).size().unstack().fillna(0)
@@ -1,27 +1,21 @@
 # map.py
 import streamlit as st
 import pandas as pd
-import requests
 import pydeck as pdk
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime, timedelta
+from ingest import fetch_crimes
 
 @st.cache_data
 def load_data():
-    url = "https://data.cityofchicago.org/resource/ijzp-q8t2.json"
-    data = requests.get(url, params={"$limit": 10000}).json()  # Fetching 10,000 records
+    df = fetch_crimes(limit=10000)  # Fetching 10,000 records
     community_area = pd.read_csv('community_area.csv', sep=';')
     community_area = community_area[['Number', 'Name']]
     
-    df = pd.DataFrame(data)
-    df['community_area'] = df['community_area'].astype(int)
-    df['date'] = pd.to_datetime(df['date'])
     df['month'] = df['date'].dt.month
     df['day'] = df['date'].dt.day
     df['hour'] = df['date'].dt.hour
-    df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
-    df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
     df = pd.merge(df, community_area, left_on='community_area', right_on='Number', how='left')
     
     return df.dropna(subset=['latitude', 'longitude'])
@@ -0,0 +1,76 @@
+# test_ingest.py
+import gzip
+import io
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+import ingest
+from ingest import read_crimes_csv
+
+# Shaped like the Socrata CSV export: quoted header, .000 timestamps,
+# lowercase booleans and blank cells for missing values
+SAMPLE_CSV = b'''"case_number","block","iucr","beat","district","ward","fbi_code","date","primary_type","description","location_description","arrest","community_area","latitude","longitude"
+"JH123456","001XX E ILLINOIS ST","0820","1834","018","42","06","2024-03-01T13:45:00.000","THEFT","$500 AND UNDER","STREET","false","8","41.89","-87.62"
+"JH123457","062XX S KING DR","0486","0312","003","20","08B","2024-03-02T02:10:00.000","BATTERY","SIMPLE","APARTMENT","true",,,
+"JH123458","034XX N HALSTED ST","1025","1924","019","44","09","2024-03-03T20:00:00.000","ARSON","BY FIRE","RESIDENCE",,"6","41.88","-87.63"
+'''
+
+
+def load_sample():
+    return read_crimes_csv(io.BytesIO(SAMPLE_CSV))
+
+
+def test_read_crimes_csv_types():
+    df = load_sample()
+
+    assert pd.api.types.is_datetime64_any_dtype(df['date'])
+    assert df['date'][0] == pd.Timestamp('2024-03-01 13:45')
+    assert df['arrest'].dtype == 'boolean'
+    assert df['arrest'].isna().tolist() == [False, False, True]
+    assert df['arrest'].value_counts().to_dict() == {False: 1, True: 1}
+    assert df['community_area'].dtype == 'Int64'
+    assert df['community_area'].isna().tolist() == [False, True, False]
+    assert df['latitude'].dtype == 'float64'
+    assert df['longitude'].isna().tolist() == [False, True, False]
+    for column in ['primary_type', 'description', 'location_description']:
+        assert not isinstance(df[column].dtype, pd.CategoricalDtype)
+
+
+class GzipCSVHandler(BaseHTTPRequestHandler):
+    # Stands in for the Socrata export endpoint: records the request and
+    # answers with the sample CSV gzip-encoded on the wire
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.headers.get('Accept-Encoding', ''), parse_qs(urlparse(self.path).query)))
+        body = gzip.compress(SAMPLE_CSV)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_fetch_crimes_streams_gzip_csv(monkeypatch):
+    server = HTTPServer(('127.0.0.1', 0), GzipCSVHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        monkeypatch.setattr(ingest, 'CRIMES_URL', f"http://127.0.0.1:{server.server_port}/ijzp-q8t2.csv")
+        df = ingest.fetch_crimes(limit=3)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    accept_encoding, params = GzipCSVHandler.requests[-1]
+    assert 'gzip' in accept_encoding
+    assert params['$limit'] == ['3']
+    assert params['$select'][0].split(',') == [ingest.DATE_COLUMN] + list(ingest.CRIME_DTYPES)
+    pd.testing.assert_frame_equal(df, load_sample())